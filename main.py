@@ -24,19 +24,45 @@ Before running:
        `gcloud beta auth application-default login`.
        For more information, see
        https://developers.google.com/identity/protocols/application-default-credentials
-    3. Install the Python client library for Google APIs by running
-       `pip install --upgrade google-api-python-client`
+    3. Install this package and its dependencies by running
+       `pip3 install .`, or `pip3 install .[http2]` to use --http2=True
 
 Run the script by terminal, for example:
-     python3 vm_network_migration.py --project_id=test-project
+     python3 main.py --project_id=test-project
      --zone=us-central1-a --original_instance_name=instance-legacy
-     --new_instance_name=vm_network_migration-new --network=tests-network
-     --subnetwork=tests-network --preserve_internal_ip=False
-     --preserve_external_ip = False --preserve_alias_ip_ranges=False
+     --new_instance_name=vm-new --network=test-network
+     --subnetwork=test-network --preserve_external_ip=False
+
+Several VMs in the same zone can be migrated concurrently by separating
+their names with commas:
+     python3 main.py --project_id=test-project
+     --zone=us-central1-a --original_instance_name=vm-1,vm-2
+     --new_instance_name=vm-1-new,vm-2-new --network=test-network
+     --subnetwork=test-network --preserve_external_ip=False --http2=True
 
 """
 import argparse
-from vm_network_migration.vm_network_migration import *
+import sys
+
+
+def str_to_bool(value) -> bool:
+    """ Convert a command line string to a boolean value.
+
+    Args:
+        value: 'true' or 'false', case insensitive
+
+    Returns:
+        True or False
+
+    Raises:
+        argparse.ArgumentTypeError: if the value is not a boolean string
+    """
+    if value.lower() == 'true':
+        return True
+    elif value.lower() == 'false':
+        return False
+    raise argparse.ArgumentTypeError('Boolean value expected: ' + value)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
@@ -45,11 +71,15 @@ if __name__ == '__main__':
     parser.add_argument('--project_id',
                         help='The project ID of the original VM.')
     parser.add_argument('--zone', help='The zone name of the original VM.')
-    parser.add_argument('--original_instance_name',
-                        help='The name of the original VM')
-    parser.add_argument('--new_instance_name',
+    parser.add_argument('--original_instance_name', required=True,
+                        help='The name of the original VM. Several VMs can'
+                             ' be migrated concurrently by separating their'
+                             ' names with commas')
+    parser.add_argument('--new_instance_name', required=True,
                         help='The name of the new VM. It should be'
-                             ' different from the original VM')
+                             ' different from the original VM. Several names'
+                             ' are separated with commas, in the same order'
+                             ' as --original_instance_name')
     parser.add_argument('--network', help='The name of the new network')
     parser.add_argument(
         '--subnetwork',
@@ -59,11 +89,43 @@ if __name__ == '__main__':
     parser.add_argument(
         '--preserve_external_ip',
         default=False,
+        type=str_to_bool,
         help='Preserve the external IP address')
+    parser.add_argument(
+        '--http2',
+        default=False,
+        type=str_to_bool,
+        help='Send the API calls over HTTP/2. It needs the http2 extra of'
+             ' this package')
 
     args = parser.parse_args()
-    # main(args.project_id, args.zone, args.original_instance_name,
-    #      args.new_instance_name, args.network, args.subnetwork)
-    main(args.project_id, args.zone, args.original_instance_name,
-          args.new_instance_name, args.network, args.subnetwork,
-          args.preserve_external_ip)
\ No newline at end of file
+    original_instances = args.original_instance_name.split(',')
+    new_instances = args.new_instance_name.split(',')
+    if len(original_instances) != len(new_instances):
+        parser.error('--original_instance_name and --new_instance_name '
+                     'should have the same number of VMs')
+    # The Google API client is imported after the arguments are parsed,
+    # so that invalid arguments and --help are handled without loading it
+    from vm_network_migration.transport import open_compute_service
+    from vm_network_migration.vm_network_migration import main
+    from vm_network_migration.vm_network_migration import migrate_instances
+
+    # Build the compute service once, so that the discovery document is not
+    # fetched again and the pooled connections are reused by all the API calls
+    with open_compute_service(http2=args.http2) as compute:
+        if len(original_instances) == 1:
+            migrated = main(args.project_id, args.zone,
+                            args.original_instance_name,
+                            args.new_instance_name, args.network,
+                            args.subnetwork, args.preserve_external_ip,
+                            compute)
+            if not migrated:
+                sys.exit(1)
+        else:
+            failed_instances = migrate_instances(
+                args.project_id, args.zone,
+                list(zip(original_instances, new_instances)),
+                args.network, args.subnetwork, args.preserve_external_ip,
+                compute)
+            if failed_instances:
+                sys.exit(1)
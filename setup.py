@@ -26,11 +26,14 @@ install_requires = [
     "httplib2>=0.9.2,<1dev",
     "google-auth>=1.16.0",
     "google-auth-httplib2>=0.0.3",
+    "requests>=2.20.0",
+    # Retry(allowed_methods=...) was added in urllib3 1.26
+    "urllib3>=1.26.0",
     "google-api-core>=1.18.0,<2dev",
-    "google-api-python-client",
+    # static_discovery and Resource.close() need the 2.x client
+    "google-api-python-client>=2.0.0",
     "google",
-    "timeout_decorator",
-    "unittest2"
+    "timeout_decorator"
 ]
 
 
@@ -43,4 +46,8 @@ setup(
    test_suite = 'tests',
    packages=['vm_network_migration'],  #same as name
    install_requires=install_requires, #external packages as dependencies
+   extras_require={
+       # Send the API calls over HTTP/2
+       "http2": ["httpx[http2]"],
+   },
 )
\ No newline at end of file
@@ -17,10 +17,10 @@ Test googleapi http calls
 
 import json
 import os
+import unittest
 
 import httplib2
 import timeout_decorator
-import unittest2 as unittest
 from googleapiclient.discovery import build
 from googleapiclient.http import HttpMock
 from googleapiclient.http import RequestMockBuilder
@@ -49,9 +49,7 @@ def read_json_file(filename):
 
     """
     with open(datafile(filename)) as f:
-        res = json.load(f)
-        f.close()
-    return res
+        return json.load(f)
 
 
 class BasicGoogleAPICalls(unittest.TestCase):
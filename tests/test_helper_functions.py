@@ -15,7 +15,12 @@
 Test helper functions
 """
 
-import unittest2 as unittest
+import argparse
+import threading
+import unittest
+from unittest import mock
+
+from main import str_to_bool
 from vm_network_migration.vm_network_migration import *
 
 
@@ -71,6 +76,21 @@ class ModifyInstanceTemplateWithNewNetwork(unittest.TestCase):
                                                       self.new_network_info)
 
 
+class GenerateNewNetworkInfo(unittest.TestCase):
+    def test_basic(self):
+        network_info = {
+            "name": "mock_network",
+            "selfLink": "https://www.googleapis.com/compute/v1/projects/mock_project/global/networks/mock_network"}
+        region = "https://www.googleapis.com/compute/v1/projects/mock_project/regions/mock_region"
+
+        new_network_info = generate_new_network_info(network_info, region,
+                                                     "mock_subnet")
+        self.assertEqual(new_network_info["network"],
+                         network_info["selfLink"])
+        self.assertEqual(new_network_info["subnetwork"],
+                         region + "/subnetworks/mock_subnet")
+
+
 class GenerateExternalIPAddressBody(unittest.TestCase):
     def test_basic(self):
         external_ip_address = "125.125.125.125"
@@ -80,3 +100,93 @@ class GenerateExternalIPAddressBody(unittest.TestCase):
         self.assertEqual(external_ip_address_body["address"],
                          external_ip_address)
         self.assertTrue(new_instance_name in external_ip_address_body["name"])
+
+
+class GenerateWaitTime(unittest.TestCase):
+    def test_exponential_growth(self):
+        self.assertGreaterEqual(generate_wait_time(0), 0.25)
+        self.assertLess(generate_wait_time(0), 0.5)
+        self.assertGreaterEqual(generate_wait_time(2), 1)
+        self.assertLess(generate_wait_time(2), 1.25)
+
+    def test_cap(self):
+        self.assertEqual(generate_wait_time(5), 5)
+        self.assertEqual(generate_wait_time(10000), 5)
+
+
+class StrToBool(unittest.TestCase):
+    def test_true(self):
+        self.assertTrue(str_to_bool('True'))
+        self.assertTrue(str_to_bool('true'))
+
+    def test_false(self):
+        self.assertFalse(str_to_bool('false'))
+        self.assertFalse(str_to_bool('FALSE'))
+
+    def test_invalid_value(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            str_to_bool('yes')
+
+
+class ConfirmPreserveExternalIP(unittest.TestCase):
+    @mock.patch('builtins.input')
+    def test_not_preserved(self, *mocks):
+        self.assertFalse(confirm_preserve_external_ip(False))
+        mocks[0].assert_not_called()
+
+    @mock.patch('builtins.input', return_value='y')
+    def test_confirmed(self, *mocks):
+        self.assertTrue(confirm_preserve_external_ip(True))
+        mocks[0].assert_called_once()
+
+    @mock.patch('builtins.input', return_value='n')
+    def test_declined(self, *mocks):
+        self.assertFalse(confirm_preserve_external_ip(True))
+
+
+class PrintMessage(unittest.TestCase):
+    @mock.patch('builtins.print')
+    def test_without_prefix(self, *mocks):
+        print_message('mock message')
+        mocks[0].assert_called_once_with('mock message')
+
+    @mock.patch('builtins.print')
+    def test_with_prefix(self, *mocks):
+        with message_prefix('mock_instance'):
+            print_message('mock message')
+        mocks[0].assert_called_once_with('[mock_instance]', 'mock message')
+        # The prefix is removed on exit
+        print_message('mock message')
+        mocks[0].assert_called_with('mock message')
+
+    @mock.patch('builtins.print')
+    def test_nested_prefix(self, *mocks):
+        with message_prefix('mock_instance_1'):
+            with message_prefix('mock_instance_2'):
+                print_message('mock message')
+            mocks[0].assert_called_with('[mock_instance_2]', 'mock message')
+            # The previous prefix is restored
+            print_message('mock message')
+            mocks[0].assert_called_with('[mock_instance_1]', 'mock message')
+
+    @mock.patch('builtins.print')
+    def test_prefix_per_thread(self, *mocks):
+        with message_prefix('mock_instance_1'):
+            # Another thread doesn't see the prefix of this thread
+            thread = threading.Thread(target=print_message,
+                                      args=('mock message',))
+            thread.start()
+            thread.join()
+            mocks[0].assert_called_with('mock message')
+
+            def print_prefixed_message():
+                with message_prefix('mock_instance_2'):
+                    print_message('mock message')
+
+            # Nor does this thread see the prefix of another thread
+            thread = threading.Thread(target=print_prefixed_message)
+            thread.start()
+            thread.join()
+            mocks[0].assert_called_with('[mock_instance_2]', 'mock message')
+            print_message('mock message')
+            mocks[0].assert_called_with('[mock_instance_1]', 'mock message')
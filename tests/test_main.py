@@ -17,11 +17,12 @@ Test main() function
 
 import json
 import os
+import unittest
 from unittest import mock
 from unittest.mock import patch
 
+import google.auth.credentials
 import httplib2
-import unittest2 as unittest
 from vm_network_migration.vm_network_migration import *
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
@@ -47,9 +48,7 @@ def read_json_file(filename):
 
     """
     with open(datafile(filename)) as f:
-        res = json.load(f)
-        f.close()
-    return res
+        return json.load(f)
 
 
 @patch(
@@ -89,9 +88,11 @@ class MainFlowLogic(unittest.TestCase):
         target_subnetwork = "target-subnetwork"
 
         # No errors
-        self.assertIsNone(
+        self.assertTrue(
             main(self.project, self.zone, original_instance, new_instance,
                  target_network, target_subnetwork))
+        # The target network is only fetched once
+        mocks[6].assert_called_once()
         # Check the new instance template is used to create a new instance
         # and it should have the same key-value pairs as the original one's
         # except for the network interface and the name
@@ -138,8 +139,9 @@ class MainFlowLogic(unittest.TestCase):
         target_network = "target-network"
         target_subnetwork = "target-subnetwork"
 
-        main(self.project, self.zone, original_instance, new_instance,
-             target_network, target_subnetwork)
+        self.assertFalse(
+            main(self.project, self.zone, original_instance, new_instance,
+                 target_network, target_subnetwork))
         # rollback will be called
         mocks[10].assert_called()
         # check the original instance is passed into rollback
@@ -212,7 +214,7 @@ class MainFlowLogic(unittest.TestCase):
         target_network = "mock_target_network"
         target_subnetwork = None
 
-        self.assertIsNone(
+        self.assertTrue(
             main(self.project, self.zone, original_instance, new_instance,
                  target_network, target_subnetwork))
 
@@ -439,3 +441,83 @@ class MainFlowHttpErrorHandling(unittest.TestCase):
              target_network, target_subnetwork)
         # the original instance is not terminated
         mocks[1].assert_not_called()
+
+
+@patch("vm_network_migration.vm_network_migration.get_zone")
+@patch("vm_network_migration.vm_network_migration.migrate_instance")
+@patch("vm_network_migration.transport.build_compute_service")
+@patch("google.auth.default")
+class MigrateInstances(unittest.TestCase):
+    MOCK_CREDENTIALS = mock.Mock(spec=google.auth.credentials.Credentials)
+    project = "mock_project"
+    zone = "mock_us_central1_a"
+    region = "https://www.googleapis.com/compute/v1/projects/mock_project/regions/mock_us_central1"
+    instance_names = [("mock_original_instance_1", "mock_new_instance_1"),
+                      ("mock_original_instance_2", "mock_new_instance_2")]
+
+    def test_basic(self, *mocks):
+        mocks[0].return_value = (self.MOCK_CREDENTIALS, self.project)
+        mocks[2].return_value = True
+        mocks[3].return_value = {"region": self.region}
+
+        failed_instances = migrate_instances(
+            self.project, self.zone, self.instance_names, "target-network",
+            "target-subnetwork")
+        self.assertEqual(failed_instances, [])
+        # Every VM is migrated with the same compute service, which is
+        # closed at the end
+        self.assertEqual(mocks[2].call_count, 2)
+        mocks[1].assert_called_once()
+        mocks[1].return_value.close.assert_called_once()
+        migrated_instances = sorted(
+            (call[0][3], call[0][4]) for call in mocks[2].call_args_list)
+        self.assertEqual(migrated_instances, self.instance_names)
+        for call in mocks[2].call_args_list:
+            self.assertIs(call[0][0], mocks[1].return_value)
+        # The region is only requested once, and shared by the VMs
+        mocks[3].assert_called_once()
+        for call in mocks[2].call_args_list:
+            self.assertEqual(call[0][8], self.region)
+
+    def test_failed_migration(self, *mocks):
+        mocks[0].return_value = (self.MOCK_CREDENTIALS, self.project)
+        results = {"mock_original_instance_1": False,
+                   "mock_original_instance_2": True,
+                   "mock_original_instance_3": MissingSubnetworkError()}
+
+        def migrate_instance(compute, project, zone, original_instance,
+                             *args):
+            result = results[original_instance]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        mocks[2].side_effect = migrate_instance
+        instance_names = self.instance_names + [
+            ("mock_original_instance_3", "mock_new_instance_3")]
+
+        failed_instances = migrate_instances(
+            self.project, self.zone, instance_names, "target-network",
+            "target-subnetwork")
+        self.assertEqual(failed_instances, ["mock_original_instance_1",
+                                            "mock_original_instance_3"])
+        # The other VMs are still migrated
+        self.assertEqual(mocks[2].call_count, 3)
+
+    def test_duplicate_instance_name(self, *mocks):
+        instance_names = [("mock_instance_a", "mock_instance_b"),
+                          ("mock_instance_b", "mock_instance_c")]
+
+        with self.assertRaises(DuplicateInstanceNameError):
+            migrate_instances(self.project, self.zone, instance_names,
+                              "target-network", "target-subnetwork")
+        mocks[1].assert_not_called()
+        mocks[2].assert_not_called()
+
+    def test_unchanged_instance_name(self, *mocks):
+        instance_names = [("mock_instance_a", "mock_instance_a")]
+
+        with self.assertRaises(UnchangedInstanceNameError):
+            migrate_instances(self.project, self.zone, instance_names,
+                              "target-network", "target-subnetwork")
+        mocks[2].assert_not_called()
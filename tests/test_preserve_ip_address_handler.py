@@ -15,17 +15,20 @@
 Test roll_back_original_instance() function
 """
 
+import copy
+import functools
 import json
 import os
+import unittest
 from unittest import mock
 
 import google.auth.credentials
 import httplib2
-import unittest2 as unittest
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
 from googleapiclient.http import HttpMock
 from googleapiclient.http import RequestMockBuilder
-from vm_network_migration.vm_network_migration import *
+from vm_network_migration.vm_network_migration import discovery
+from vm_network_migration.vm_network_migration import preserve_ip_addresses_handler
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
@@ -41,8 +44,10 @@ def datafile(filename):
     return os.path.join(DATA_DIR, filename)
 
 
+@functools.lru_cache(maxsize=None)
 def read_json_file(filename):
-    """Read *.json file
+    """Read *.json file. The file is only parsed once, so the returned
+    object should not be modified.
     Args:
         filename: json file name
 
@@ -50,22 +55,16 @@ def read_json_file(filename):
 
     """
     with open(datafile(filename)) as f:
-        res = json.load(f)
-        f.close()
-    return res
+        return json.load(f)
 
 
 class PreserveIPAddressHandler(unittest.TestCase):
     MOCK_CREDENTIALS = mock.Mock(spec=google.auth.credentials.Credentials)
-    compute = discovery.build('compute', 'v1',
-                              credentials=MOCK_CREDENTIALS)
     project = "mock_project"
     zone = "mock_us_central1_a"
     region = "mock_us_central1"
     original_instance = "mock_instance_legacy"
     new_instance = "mock_instance_new"
-    http = HttpMock(datafile("compute_rest.json"), {
-        "status": "200"})
     external_ip_address_body = {
         "name": "example-external-address",
         "address": "35.203.14.22"
@@ -90,6 +89,27 @@ class PreserveIPAddressHandler(unittest.TestCase):
         "subnetwork": "https://www.googleapis.com/compute/v1/projects/mock_project/regions/us-central1/subnetworks/mock_target_subnetwork"
     }
 
+    @classmethod
+    def setUpClass(cls):
+        cls.compute = discovery.build('compute', 'v1',
+                                      credentials=cls.MOCK_CREDENTIALS,
+                                      static_discovery=True,
+                                      cache_discovery=False)
+        # The API calls are answered by RequestMockBuilder, so the http
+        # object is never used
+        cls.http = HttpMock(None, {"status": "200"})
+        # Build the services from the parsed discovery document instead of
+        # fetching and parsing it in every test. build_from_document() only
+        # adds the standard parameters to it, so it can be shared.
+        cls.compute_discovery_document = read_json_file("compute_rest.json")
+        cls.network_interface = read_json_file(
+            "sample_instance_template.json")["networkInterfaces"][0]
+        cls.no_natIP_network_interface = read_json_file(
+            "sample_instance_template_no_natIP.json")["networkInterfaces"][0]
+        cls.no_external_ip_network_interface = read_json_file(
+            "sample_instance_template_no_external_ip.json")[
+            "networkInterfaces"][0]
+
     def test_not_preserve_external_ip(self):
         request_builder = RequestMockBuilder(
             {
@@ -97,11 +117,10 @@ class PreserveIPAddressHandler(unittest.TestCase):
                     self.successResponse, '{"name": "bar"}'),
                 "compute.regionOperations.get":(
                     self.successResponse, '{"status":"DONE"}')})
-        compute = build("compute", "v1", self.http,
-                        requestBuilder=request_builder)
-        original_instance_template = read_json_file(
-            "sample_instance_template.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        compute = build_from_document(self.compute_discovery_document,
+                                      http=self.http,
+                                      requestBuilder=request_builder)
+        original_network_interface = copy.deepcopy(self.network_interface)
         new_network_interface = preserve_ip_addresses_handler(compute,
                                                               self.project,
                                                               self.new_instance,
@@ -125,11 +144,10 @@ class PreserveIPAddressHandler(unittest.TestCase):
                     self.successResponse, '{"name": "bar"}'),
                 "compute.regionOperations.get":(
                     self.successResponse, '{"status":"DONE"}')})
-        compute = build("compute", "v1", self.http,
-                        requestBuilder=request_builder)
-        original_instance_template = read_json_file(
-            "sample_instance_template.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        compute = build_from_document(self.compute_discovery_document,
+                                      http=self.http,
+                                      requestBuilder=request_builder)
+        original_network_interface = copy.deepcopy(self.network_interface)
         new_network_interface = preserve_ip_addresses_handler(compute,
                                                               self.project,
                                                               self.new_instance,
@@ -154,11 +172,10 @@ class PreserveIPAddressHandler(unittest.TestCase):
                     self.alreadyExistsResponse, b''),
                 "compute.regionOperations.get":(
                     self.successResponse, '{"status":"DONE"}')})
-        compute = build("compute", "v1", self.http,
-                        requestBuilder=request_builder)
-        original_instance_template = read_json_file(
-            "sample_instance_template.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        compute = build_from_document(self.compute_discovery_document,
+                                      http=self.http,
+                                      requestBuilder=request_builder)
+        original_network_interface = copy.deepcopy(self.network_interface)
         new_network_interface = preserve_ip_addresses_handler(compute,
                                                               self.project,
                                                               self.new_instance,
@@ -185,11 +202,10 @@ class PreserveIPAddressHandler(unittest.TestCase):
                     self.staticIPNameExistsResponse, b''),
                 "compute.regionOperations.get": (
                     self.successResponse, '{"status":"DONE"}')})
-        compute = build("compute", "v1", self.http,
-                        requestBuilder=request_builder)
-        original_instance_template = read_json_file(
-            "sample_instance_template.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        compute = build_from_document(self.compute_discovery_document,
+                                      http=self.http,
+                                      requestBuilder=request_builder)
+        original_network_interface = copy.deepcopy(self.network_interface)
         new_network_interface = preserve_ip_addresses_handler(compute,
                                                               self.project,
                                                               self.new_instance,
@@ -215,11 +231,10 @@ class PreserveIPAddressHandler(unittest.TestCase):
                     self.otherErrorResponse, b''),
                 "compute.regionOperations.get": (
                     self.successResponse, '{"status":"DONE"}')})
-        compute = build("compute", "v1", self.http,
-                        requestBuilder=request_builder)
-        original_instance_template = read_json_file(
-            "sample_instance_template.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        compute = build_from_document(self.compute_discovery_document,
+                                      http=self.http,
+                                      requestBuilder=request_builder)
+        original_network_interface = copy.deepcopy(self.network_interface)
         new_network_interface = preserve_ip_addresses_handler(compute,
                                                               self.project,
                                                               self.new_instance,
@@ -238,9 +253,7 @@ class PreserveIPAddressHandler(unittest.TestCase):
     def test_no_natIP_exists_in_original_vm(self):
         # No error raises, and the original external IP will be used
         # in the new instance template
-        original_instance_template = read_json_file(
-            "sample_instance_template_no_natIP.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        original_network_interface = copy.deepcopy(self.no_natIP_network_interface)
         new_network_interface = preserve_ip_addresses_handler(self.compute,
                                                               self.project,
                                                               self.new_instance,
@@ -259,9 +272,7 @@ class PreserveIPAddressHandler(unittest.TestCase):
     def test_no_external_ip_exists_in_original_vm(self):
         # No error raises, and the original external IP will be used
         # in the new instance template
-        original_instance_template = read_json_file(
-            "sample_instance_template_no_external_ip.json")
-        original_network_interface = original_instance_template["networkInterfaces"][0]
+        original_network_interface = copy.deepcopy(self.no_external_ip_network_interface)
         new_network_interface = preserve_ip_addresses_handler(self.compute,
                                                               self.project,
                                                               self.new_instance,
@@ -17,12 +17,12 @@ Test roll_back_original_instance() function
 
 import json
 import os
+import unittest
 from unittest import mock
 from unittest.mock import patch
 
 import google.auth.credentials
 import httplib2
-import unittest2 as unittest
 from vm_network_migration.vm_network_migration import *
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
@@ -48,9 +48,7 @@ def read_json_file(filename):
 
     """
     with open(datafile(filename)) as f:
-        res = json.load(f)
-        f.close()
-    return res
+        return json.load(f)
 
 
 @patch("vm_network_migration.vm_network_migration.create_instance")  # index: 4
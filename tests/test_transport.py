@@ -0,0 +1,238 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the HTTP transport of the compute service
+"""
+
+import json
+import unittest
+from unittest import mock
+
+import google.auth.credentials
+import requests
+from googleapiclient import discovery
+from googleapiclient.errors import HttpError
+from vm_network_migration import transport
+from vm_network_migration.transport import *
+
+
+class StubSession(object):
+    """A requests session which returns the given responses in order,
+    and records the requests"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, uri, data=None, headers=None, timeout=None):
+        self.requests.append((method, uri, data, headers, timeout))
+        status_code, reason, content = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.headers["Content-Type"] = "application/json"
+        response._content = content
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+def build_compute(http):
+    return discovery.build("compute", "v1", http=http,
+                           static_discovery=True, cache_discovery=False)
+
+
+class GenerateHttplib2Response(unittest.TestCase):
+    def test_basic(self):
+        response = generate_httplib2_response(
+            404, "Not Found", {"Content-Type": "application/json"})
+        self.assertEqual(response.status, 404)
+        self.assertEqual(response.reason, "Not Found")
+        self.assertEqual(response["status"], "404")
+        self.assertEqual(response["content-type"], "application/json")
+
+
+class RequestsHttpTransport(unittest.TestCase):
+    project = "mock_project"
+    zone = "mock_us_central1_a"
+    region = "mock_us_central1"
+
+    def test_get(self):
+        session = StubSession((200, "OK", b'{"name": "mock_zone"}'))
+        compute = build_compute(RequestsHttp(session))
+
+        zone = compute.zones().get(project=self.project,
+                                   zone=self.zone).execute()
+        self.assertEqual(zone, {"name": "mock_zone"})
+        method, uri, data, headers, timeout = session.requests[0]
+        self.assertEqual(method, "GET")
+        self.assertIn("/projects/mock_project/zones/mock_us_central1_a", uri)
+        self.assertEqual(timeout, DEFAULT_TIMEOUT)
+
+    def test_post(self):
+        session = StubSession((200, "OK", b'{"name": "mock_operation"}'))
+        compute = build_compute(RequestsHttp(session))
+        address_body = {
+            "name": "example-external-address",
+            "address": "35.203.14.22"
+        }
+
+        operation = compute.addresses().insert(project=self.project,
+                                               region=self.region,
+                                               body=address_body).execute()
+        self.assertEqual(operation, {"name": "mock_operation"})
+        method, uri, data, headers, timeout = session.requests[0]
+        self.assertEqual(method, "POST")
+        self.assertEqual(json.loads(data), address_body)
+
+    def test_http_error(self):
+        session = StubSession((404, "Not Found", b'{}'))
+        compute = build_compute(RequestsHttp(session))
+
+        with self.assertRaises(HttpError) as context:
+            compute.zones().get(project=self.project,
+                                zone=self.zone).execute()
+        self.assertEqual(context.exception.resp.status, 404)
+        self.assertEqual(context.exception.resp.reason, "Not Found")
+
+    def test_close(self):
+        session = StubSession()
+        compute = build_compute(RequestsHttp(session))
+
+        compute.close()
+        self.assertTrue(session.closed)
+
+
+class BuildAuthorizedSession(unittest.TestCase):
+    MOCK_CREDENTIALS = mock.Mock(spec=google.auth.credentials.Credentials)
+
+    def test_retry_policy(self):
+        session = build_authorized_session(self.MOCK_CREDENTIALS)
+        adapter = session.get_adapter("https://compute.googleapis.com")
+        retry = adapter.max_retries
+        self.assertEqual(retry.total, RETRY_TOTAL)
+        self.assertEqual(set(retry.status_forcelist), RETRY_STATUS_CODES)
+        self.assertNotIn("POST", retry.allowed_methods)
+
+
+@unittest.skipIf(transport.httpx is None, "httpx is not installed")
+class HttpxHttpTransport(unittest.TestCase):
+    project = "mock_project"
+    zone = "mock_us_central1_a"
+
+    def build_http(self, handler):
+        client = transport.httpx.Client(
+            transport=transport.httpx.MockTransport(handler))
+        return HttpxHttp(client)
+
+    def test_get(self):
+        def handler(request):
+            return transport.httpx.Response(
+                200, headers={"Content-Type": "application/json"},
+                content=b'{"name": "mock_zone"}')
+
+        compute = build_compute(self.build_http(handler))
+        zone = compute.zones().get(project=self.project,
+                                   zone=self.zone).execute()
+        self.assertEqual(zone, {"name": "mock_zone"})
+
+    def test_http_error(self):
+        def handler(request):
+            return transport.httpx.Response(404, content=b'{}')
+
+        compute = build_compute(self.build_http(handler))
+        with self.assertRaises(HttpError) as context:
+            compute.zones().get(project=self.project,
+                                zone=self.zone).execute()
+        self.assertEqual(context.exception.resp.status, 404)
+        self.assertEqual(context.exception.resp.reason, "Not Found")
+
+    @mock.patch("vm_network_migration.transport.time.sleep")
+    def test_retry_idempotent_request(self, *mocks):
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            status_code = 503 if len(methods) < 3 else 200
+            return transport.httpx.Response(status_code, content=b'{}')
+
+        response, content = self.build_http(handler).request(
+            "https://compute.googleapis.com", "GET")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(methods, ["GET"] * 3)
+
+    @mock.patch("vm_network_migration.transport.time.sleep")
+    def test_no_retry_for_post(self, *mocks):
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return transport.httpx.Response(503, content=b'{}')
+
+        response, content = self.build_http(handler).request(
+            "https://compute.googleapis.com", "POST")
+        self.assertEqual(response.status, 503)
+        self.assertEqual(methods, ["POST"])
+
+    def test_transport_error(self):
+        def handler(request):
+            raise transport.httpx.ConnectError("connection refused")
+
+        with self.assertRaises(ConnectionError):
+            self.build_http(handler).request(
+                "https://compute.googleapis.com", "GET")
+
+
+class BuildComputeService(unittest.TestCase):
+    MOCK_CREDENTIALS = mock.Mock(spec=google.auth.credentials.Credentials)
+
+    def test_default_transport(self):
+        compute = build_compute_service(self.MOCK_CREDENTIALS)
+        self.assertIsInstance(compute._http, RequestsHttp)
+
+    @mock.patch("vm_network_migration.transport.httpx", None)
+    def test_http2_without_httpx(self):
+        with self.assertRaises(ImportError):
+            build_compute_service(self.MOCK_CREDENTIALS, http2=True)
+
+
+class OpenComputeService(unittest.TestCase):
+    MOCK_CREDENTIALS = mock.Mock(spec=google.auth.credentials.Credentials)
+
+    def test_given_service(self):
+        compute = mock.Mock()
+        with open_compute_service(compute) as opened_compute:
+            self.assertIs(opened_compute, compute)
+        # The caller owns the service
+        compute.close.assert_not_called()
+
+    @mock.patch("vm_network_migration.transport.build_compute_service")
+    @mock.patch("google.auth.default")
+    def test_new_service(self, *mocks):
+        mocks[0].return_value = (self.MOCK_CREDENTIALS, "mock_project")
+        with open_compute_service() as compute:
+            self.assertIs(compute, mocks[1].return_value)
+            mocks[1].assert_called_once_with(self.MOCK_CREDENTIALS, False)
+        compute.close.assert_called_once()
+
+    @mock.patch("vm_network_migration.transport.build_compute_service")
+    @mock.patch("google.auth.default")
+    def test_new_service_closed_on_error(self, *mocks):
+        mocks[0].return_value = (self.MOCK_CREDENTIALS, "mock_project")
+        with self.assertRaises(ValueError):
+            with open_compute_service():
+                raise ValueError()
+        mocks[1].return_value.close.assert_called_once()
@@ -22,6 +22,11 @@ class UnchangedInstanceNameError(IOError):
     pass
 
 
+class DuplicateInstanceNameError(IOError):
+    """A VM name appears more than once in a migration of several VMs"""
+    pass
+
+
 class InvalidTargetNetworkError(IOError):
     """Migrate to a non-VPC network"""
     pass
@@ -0,0 +1,249 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" HTTP transport for the Google API python client
+
+The default httplib2 transport keeps no connection pool and is not
+thread-safe. The helpers in this file back the compute service with a
+pooled requests session, or with an HTTP/2 httpx client if it is asked
+for and httpx is installed with its http2 extra.
+"""
+import contextlib
+import importlib.util
+import socket
+import time
+
+import google.auth
+import google_auth_httplib2
+import httplib2
+from google.auth.transport.requests import AuthorizedSession
+from googleapiclient import discovery
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# httpx needs the h2 package to speak HTTP/2
+if importlib.util.find_spec('httpx') and importlib.util.find_spec('h2'):
+    import httpx
+else:
+    httpx = None
+
+DEFAULT_TIMEOUT = 30
+# The retry policy of both transports: idempotent requests are retried
+# on these server errors
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+
+def generate_httplib2_response(status, reason, headers) -> httplib2.Response:
+    """ Generate an httplib2.Response, which is expected by the
+    Google API python client.
+
+    Args:
+        status: HTTP status code
+        reason: HTTP reason phrase
+        headers: response headers
+
+    Returns:
+        an httplib2.Response
+    """
+    response_info = {key.lower(): value for key, value in headers.items()}
+    response_info['status'] = str(status)
+    http_response = httplib2.Response(response_info)
+    http_response.reason = reason
+    return http_response
+
+
+class RequestsHttp(object):
+    """An httplib2.Http compatible wrapper of a requests session,
+    which can be passed to googleapiclient.discovery.build()"""
+
+    def __init__(self, session, timeout=DEFAULT_TIMEOUT):
+        """ Initialize the wrapper.
+
+        Args:
+            session: a requests.Session, such as an AuthorizedSession
+            timeout: timeout of each request in seconds
+        """
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=None, connection_type=None):
+        """ Send a request with the session.
+
+        Args:
+            uri: URI of the request
+            method: HTTP method
+            body: body of the request
+            headers: headers of the request
+            redirections: not used, requests follows redirects itself
+            connection_type: not used
+
+        Returns:
+            a tuple of an httplib2.Response and the response content
+        """
+        response = self.session.request(method, uri, data=body,
+                                        headers=headers,
+                                        timeout=self.timeout)
+        return generate_httplib2_response(response.status_code,
+                                          response.reason,
+                                          response.headers), response.content
+
+    def close(self):
+        """ Close the underlying session."""
+        self.session.close()
+
+
+class HttpxHttp(object):
+    """An httplib2.Http compatible wrapper of an httpx client. The requests
+    are multiplexed over HTTP/2 connections."""
+
+    def __init__(self, client=None, timeout=DEFAULT_TIMEOUT):
+        """ Initialize the wrapper.
+
+        Args:
+            client: an httpx.Client. If it is None, an HTTP/2 client
+             will be created.
+            timeout: timeout of each request in seconds
+        """
+        if client is None:
+            # The transport retries failed connections
+            client = httpx.Client(transport=httpx.HTTPTransport(
+                http2=True, retries=RETRY_TOTAL,
+                limits=httpx.Limits(max_keepalive_connections=20,
+                                    max_connections=40)))
+        self.client = client
+        self.timeout = timeout
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=None, connection_type=None):
+        """ Send a request with the client. Idempotent requests are retried
+        on server errors, in the same way as build_authorized_session().
+
+        Args:
+            uri: URI of the request
+            method: HTTP method
+            body: body of the request
+            headers: headers of the request
+            redirections: not used
+            connection_type: not used
+
+        Returns:
+            a tuple of an httplib2.Response and the response content
+
+        Raises:
+            socket.timeout: the request timed out
+            ConnectionError: the request failed in the transport
+        """
+        retry_count = 0
+        while True:
+            # Raise the errors which googleapiclient knows to be transient
+            try:
+                response = self.client.request(method, uri, content=body,
+                                               headers=headers,
+                                               timeout=self.timeout)
+            except httpx.TimeoutException as e:
+                raise socket.timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise ConnectionError(str(e)) from e
+            if retry_count >= RETRY_TOTAL or \
+                    method not in RETRY_METHODS or \
+                    response.status_code not in RETRY_STATUS_CODES:
+                break
+            time.sleep(RETRY_BACKOFF_FACTOR * 2 ** retry_count)
+            retry_count += 1
+        return generate_httplib2_response(response.status_code,
+                                          response.reason_phrase,
+                                          response.headers), response.content
+
+    def close(self):
+        """ Close the underlying client."""
+        self.client.close()
+
+
+def build_authorized_session(credentials, pool_connections=10,
+                             pool_maxsize=20) -> AuthorizedSession:
+    """ Build an authorized session with a connection pool.
+
+    Args:
+        credentials: google.auth credentials
+        pool_connections: number of connection pools to cache
+        pool_maxsize: maximum number of connections in each pool
+
+    Returns:
+        an AuthorizedSession
+    """
+    session = AuthorizedSession(credentials)
+    # Only idempotent requests are retried on server errors
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          max_retries=Retry(
+                              total=RETRY_TOTAL,
+                              backoff_factor=RETRY_BACKOFF_FACTOR,
+                              status_forcelist=RETRY_STATUS_CODES,
+                              allowed_methods=RETRY_METHODS,
+                              raise_on_status=False))
+    session.mount('https://', adapter)
+    return session
+
+
+def build_compute_service(credentials, http2=False):
+    """ Build the compute engine service over a pooled session, or over
+    an HTTP/2 client.
+
+    Args:
+        credentials: google.auth credentials
+        http2: send the requests over HTTP/2 with httpx
+
+    Returns:
+        google API compute engine service
+
+    Raises:
+        ImportError: HTTP/2 is asked for, but httpx is not installed
+    """
+    if http2:
+        if httpx is None:
+            raise ImportError('HTTP/2 needs httpx, which can be installed '
+                              'with the http2 extra of this package')
+        http = google_auth_httplib2.AuthorizedHttp(credentials,
+                                                   http=HttpxHttp())
+    else:
+        http = RequestsHttp(build_authorized_session(credentials))
+    return discovery.build('compute', 'v1', http=http,
+                           cache_discovery=False, static_discovery=True)
+
+
+@contextlib.contextmanager
+def open_compute_service(compute=None, http2=False):
+    """ Provide a compute engine service. If no service is given, a new one
+    is built with the application default credentials, and it is closed
+    on exit.
+
+    Args:
+        compute: google API compute engine service, or None
+        http2: send the requests of a new service over HTTP/2
+
+    Yields:
+        google API compute engine service
+    """
+    if compute is not None:
+        yield compute
+        return
+    credentials, default_project = google.auth.default()
+    compute = build_compute_service(credentials, http2)
+    try:
+        yield compute
+    finally:
+        compute.close()
@@ -39,14 +39,55 @@ Run the script by terminal, for example:
      --preserve_external_ip = False --preserve_alias_ip_ranges=False
 
 """
+import contextlib
 import copy
+import random
+import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
-import google.auth
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
 from vm_network_migration.errors import *
+from vm_network_migration.transport import open_compute_service
+
+# The network interface's keys which are not carried over to the new VM
+# by default. The internal IP is always ephemeral, and the external IP is
+# only kept if the user chooses to preserve it.
+EPHEMERAL_NETWORK_INTERFACE_KEYS = frozenset({'accessConfigs', 'networkIP'})
+
+# The name of the VM which is being migrated by the current thread
+message_context = threading.local()
+
+
+def print_message(*values):
+    """ Print the values. They are prefixed with the name of the VM which
+    is being migrated by the current thread, if any.
+
+    Args:
+        values: the values to print
+    """
+    instance = getattr(message_context, 'instance', None)
+    if instance is None:
+        print(*values)
+    else:
+        print('[%s]' % instance, *values)
+
+
+@contextlib.contextmanager
+def message_prefix(instance):
+    """ Prefix the messages printed by the current thread with a VM name.
+
+    Args:
+        instance: name of the VM
+    """
+    previous_instance = getattr(message_context, 'instance', None)
+    message_context.instance = instance
+    try:
+        yield
+    finally:
+        message_context.instance = previous_instance
 
 
 def stop_instance(compute, project, zone, instance) -> dict:
@@ -195,31 +236,24 @@ def get_network(compute, project, network) -> dict:
         network=network).execute()
 
 
-def generate_new_network_info(compute, project, region, network,
-                              subnetwork) -> dict:
+def generate_new_network_info(network_info, region, subnetwork) -> dict:
     """ Generate a network information dict
         based on the provided network and subnetwork
 
         Args:
-            compute: google API compute engine service
-            project: project ID
+            network_info: a dict of the network information
             region: region of the subnetwork
-            network: network name
             subnetwork: subnetwork name
 
         Returns:
             a dict of the new network interface
-
-        Raises:
-            googleapiclient.errors.HttpError: invalid request
     """
-    network_parameters = get_network(compute, project, network)
-    network_link = network_parameters['selfLink']
+    network_link = network_info['selfLink']
     subnetwork_link = region + '/subnetworks/' + subnetwork
-    network_info = {}
-    network_info['network'] = network_link
-    network_info['subnetwork'] = subnetwork_link
-    return network_info
+    new_network_info = {}
+    new_network_info['network'] = network_link
+    new_network_info['subnetwork'] = subnetwork_link
+    return new_network_info
 
 
 def modify_instance_template_with_new_network(instance_template, new_instance,
@@ -304,18 +338,20 @@ def wait_for_zone_operation(compute, project, zone, operation):
             ZoneOperationsError: if the operation has an error
             googleapiclient.errors.HttpError: invalid request
     """
-    print('Waiting ...')
+    print_message('Waiting ...')
+    retry_count = 0
     while True:
         result = compute.zoneOperations().get(
             project=project,
             zone=zone,
             operation=operation).execute()
         if result['status'] == 'DONE':
-            print("The current operation is done.")
+            print_message("The current operation is done.")
             if 'error' in result:
                 raise ZoneOperationsError(result['error'])
             return result
-        time.sleep(1)
+        time.sleep(generate_wait_time(retry_count))
+        retry_count += 1
 
 
 def wait_for_region_operation(compute, project, region, operation):
@@ -334,19 +370,38 @@ def wait_for_region_operation(compute, project, region, operation):
             RegionOperationsError: if the operation has an error
             googleapiclient.errors.HttpError: invalid request
     """
-    print('Waiting ...')
+    print_message('Waiting ...')
+    retry_count = 0
     while True:
         result = compute.regionOperations().get(
             project=project,
             region=region,
             operation=operation).execute()
         if result['status'] == 'DONE':
-            print("The current operation is done.")
+            print_message("The current operation is done.")
             if 'error' in result:
-                print('Region operations error', result['error'])
+                print_message('Region operations error', result['error'])
                 raise RegionOperationsError(result['error'])
             return result
-        time.sleep(1)
+        time.sleep(generate_wait_time(retry_count))
+        retry_count += 1
+
+
+def generate_wait_time(retry_count, base=0.25, cap=5.0) -> float:
+    """ Generate the waiting time before polling an operation again.
+    The waiting time grows exponentially with a random jitter.
+
+        Args:
+            retry_count: number of the polls which have been done
+            base: waiting time of the first poll in seconds
+            cap: maximum waiting time in seconds
+
+        Returns:
+            waiting time in seconds
+    """
+    # Stop growing the exponent once the cap is reached to avoid an overflow
+    exponent = min(retry_count, 16)
+    return min(cap, base * 2 ** exponent + random.uniform(0, base))
 
 
 def get_zone(compute, project, zone) -> dict:
@@ -384,6 +439,21 @@ def check_network_auto_mode(compute, project, network) -> bool:
         googleapiclient.errors.HttpError: invalid request
     """
     network_info = get_network(compute, project, network)
+    return get_network_auto_mode(network_info)
+
+
+def get_network_auto_mode(network_info) -> bool:
+    """ Get the auto mode status from the network information
+
+    Args:
+        network_info: a dict of the network information
+
+    Returns:
+        true or false
+
+    Raises:
+        InvalidTargetNetworkError: if the network is not a subnetwork mode network
+    """
     if 'autoCreateSubnetworks' not in network_info:
         raise InvalidTargetNetworkError(
             'The target network is not a subnetwork mode network')
@@ -454,14 +524,14 @@ def rollback_failure_protection(compute, project, zone, instance,
                                    all_disks_info, instance_deleted)
     except Exception as e:
         warnings.warn("Rollback failed.", Warning)
-        print(e)
-        print(
+        print_message(e)
+        print_message(
             "The original VM may have been deleted. "
             "The instance template of the original VM is: ")
-        print(original_instance_template)
+        print_message(original_instance_template)
         return False
 
-    print('Rollback finished. The original VM is running.')
+    print_message('Rollback finished. The original VM is running.')
     return True
 
 
@@ -486,17 +556,17 @@ def rollback_original_instance(compute, project, zone, instance,
         'VM network migration is failed. Rolling back to the original VM.',
         Warning)
 
-    print(original_instance_template)
+    print_message(original_instance_template)
 
     if not instance_deleted:
         for disk_info in all_disks_info:
-            print('attach_disk_operation is running')
+            print_message('attach_disk_operation is running')
             attach_disk_operation = attach_disk(compute, project, zone,
                                                 instance, disk_info)
             wait_for_zone_operation(compute, project, zone,
                                     attach_disk_operation['name'])
-        print('Restarting the original VM')
-        print('start_instance_operation is running')
+        print_message('Restarting the original VM')
+        print_message('start_instance_operation is running')
         start_instance_operation = start_instance(compute, project, zone,
                                                   instance)
         wait_for_zone_operation(compute, project, zone,
@@ -514,7 +584,8 @@ def preserve_ip_addresses_handler(compute, project, new_instance_name,
                                   new_network_info, original_network_interface,
                                   region,
                                   preserve_external_ip) -> dict:
-    """Preserve the external IP address.
+    """Generate the network interface of the new VM. The external IP
+    address of the original VM is preserved if it is asked for.
 
     Args:
         compute: google API compute engine service
@@ -528,54 +599,92 @@ def preserve_ip_addresses_handler(compute, project, new_instance_name,
     Returns:
         network interface of the new VM
     """
-    new_network_interface = copy.deepcopy(original_network_interface)
+    if preserve_external_ip:
+        return generate_network_interface_with_static_external_ip(
+            compute, project, new_instance_name, new_network_info,
+            original_network_interface, region)
+    return generate_network_interface(new_network_info,
+                                      original_network_interface)
+
+
+def generate_network_interface(new_network_info,
+                               original_network_interface) -> dict:
+    """Generate the new network interface with ephemeral IP addresses.
+
+    Args:
+        new_network_info: selfLinks of current network and subnet
+        original_network_interface: network interface of the original VM
+
+    Returns:
+        network interface of the new VM
+    """
+    # A shallow copy is enough, since the nested values of the original
+    # network interface are never modified
+    new_network_interface = {key: value for key, value in
+                             original_network_interface.items() if
+                             key not in EPHEMERAL_NETWORK_INTERFACE_KEYS}
     new_network_interface['network'] = new_network_info['network']
     new_network_interface['subnetwork'] = new_network_info['subnetwork']
-    if preserve_external_ip:
-        print('Preserving the external IP address')
-        # There is no external ip assigned to the original VM
-        # An ephemeral external ip will be assigned to the new VM
-        if 'accessConfigs' not in new_network_interface or 'natIP' not in \
-                new_network_interface['accessConfigs'][0]:
-            warnings.warn(
-                'The current VM has no external IP address. \
-                An ephemeral external IP address will be assigned to the new VM',
-                Warning)
-            pass
-        else:
-            external_ip_address = new_network_interface['accessConfigs'][0][
-                'natIP']
-            external_ip_address_body = generate_external_ip_address_body(
-                external_ip_address, new_instance_name)
-            try:
-                preserve_external_ip_operation = preserve_external_ip_address(
-                    compute, project, region,
-                    external_ip_address_body)
-                wait_for_region_operation(compute, project, region,
-                                          preserve_external_ip_operation[
-                                              'name'])
-            except HttpError as e:
-                error_reason = e._get_reason()
-                # The external IP is already preserved as a static IP,
-                # or the current name of the external IP already exists
-                if 'already' in error_reason:
-                    warnings.warn(error_reason, Warning)
-                else:
-                    warnings.warn(
-                        'Failed to preserve the external IP address as a static IP.',
-                        Warning)
-                    print(e._get_reason())
-                    print('An ephemeral external IP address will be assigned.')
-                    del new_network_interface['accessConfigs']
-            else:
-                print(
-                    'The external IP address is reserved as a static IP address.')
+    return new_network_interface
+
+
+def generate_network_interface_with_static_external_ip(
+        compute, project, new_instance_name, new_network_info,
+        original_network_interface, region) -> dict:
+    """Reserve the external IP address of the original VM as a static IP,
+    and generate the new network interface which uses it.
 
-    elif 'accessConfigs' in new_network_interface:
-        del new_network_interface['accessConfigs']
-    # Use an ephemeral internal IP for the new VM
-    del new_network_interface['networkIP']
+    Args:
+        compute: google API compute engine service
+        project: project ID
+        new_instance_name: name of the new VM
+        new_network_info: selfLinks of current network and subnet
+        original_network_interface: network interface of the original VM
+        region: region of original VM
 
+    Returns:
+        network interface of the new VM
+    """
+    new_network_interface = generate_network_interface(
+        new_network_info, original_network_interface)
+    print_message('Preserving the external IP address')
+    access_configs = original_network_interface.get('accessConfigs')
+    # There is no external ip assigned to the original VM
+    # An ephemeral external ip will be assigned to the new VM
+    if not access_configs or 'natIP' not in access_configs[0]:
+        warnings.warn(
+            'The current VM has no external IP address. \
+            An ephemeral external IP address will be assigned to the new VM',
+            Warning)
+    else:
+        external_ip_address = access_configs[0]['natIP']
+        external_ip_address_body = generate_external_ip_address_body(
+            external_ip_address, new_instance_name)
+        try:
+            preserve_external_ip_operation = preserve_external_ip_address(
+                compute, project, region,
+                external_ip_address_body)
+            wait_for_region_operation(compute, project, region,
+                                      preserve_external_ip_operation[
+                                          'name'])
+        except HttpError as e:
+            error_reason = e._get_reason()
+            # The external IP is already preserved as a static IP,
+            # or the current name of the external IP already exists
+            if 'already' in error_reason:
+                warnings.warn(error_reason, Warning)
+            else:
+                warnings.warn(
+                    'Failed to preserve the external IP address as a static IP.',
+                    Warning)
+                print_message(e._get_reason())
+                print_message('An ephemeral external IP address will be assigned.')
+                return new_network_interface
+        else:
+            print_message(
+                'The external IP address is reserved as a static IP address.')
+    if access_configs is not None:
+        new_network_interface['accessConfigs'] = access_configs
     return new_network_interface
 
 
@@ -608,8 +717,30 @@ def generate_timestamp_string() -> str:
     return str(time.strftime("%s", time.gmtime()))
 
 
+def confirm_preserve_external_ip(preserve_external_ip) -> bool:
+    """ Ask the user to confirm preserving the external IP.
+
+        Args:
+            preserve_external_ip: preserve the current external IP or not
+
+        Returns:
+            preserve the current external IP or not
+    """
+    if preserve_external_ip:
+        warnings.warn(
+            'You choose to preserve the external IP. If the original instance '
+            'has an ephemeral IP, it will be reserved as a static IP after the '
+            'execution,',
+            Warning)
+        continue_execution = input(
+            'Do you still want to preserve the external IP? y/n')
+        if continue_execution == 'n':
+            preserve_external_ip = False
+    return preserve_external_ip
+
+
 def main(project, zone, original_instance, new_instance, network, subnetwork,
-         preserve_external_ip=False):
+         preserve_external_ip=False, compute=None) -> bool:
     """ Execute the migration process.
 
         Args:
@@ -620,118 +751,236 @@ def main(project, zone, original_instance, new_instance, network, subnetwork,
             network: name of the target network
             subnetwork: name of the target subnet
             preserve_external_ip: preserve the current external IP or not
+            compute: google API compute engine service. If it is None, a new
+             one will be built with the application default credentials.
+
+        Returns:
+            True if the VM is migrated. False if the migration is terminated
+            or rolled back.
 
         Raises:
-            UnchangedInstanceNameError: if the network mode is not auto and
+            UnchangedInstanceNameError: if new_instance == orignal_instance
+            MissingSubnetworkError: if the network mode is not auto and
              the subnetwork is not specified
-            MissingSubnetworkError: if new_instance == orignal_instance
             googleapiclient.errors.HttpError: invalid request
     """
 
-    credentials, default_project = google.auth.default()
-    compute = discovery.build('compute', 'v1', credentials=credentials)
-    if preserve_external_ip:
-        warnings.warn(
-            'You choose to preserve the external IP. If the original instance '
-            'has an ephemeral IP, it will be reserved as a static IP after the '
-            'execution,',
-            Warning)
-        continue_execution = input(
-            'Do you still want to preserve the external IP? y/n')
-        if continue_execution == 'n':
-            preserve_external_ip = False
+    preserve_external_ip = confirm_preserve_external_ip(preserve_external_ip)
+    with open_compute_service(compute) as compute:
+        return migrate_instance(compute, project, zone, original_instance,
+                                new_instance, network, subnetwork,
+                                preserve_external_ip)
 
-    if new_instance == original_instance:
-        raise UnchangedInstanceNameError(
-            'The new VM should not have the same name as the original VM')
 
-    # If the network is auto, then the subnetwork name is optional.
-    # Otherwise it should be specified
-    automode_status = check_network_auto_mode(compute, project, network)
-    if subnetwork is None:
-        if not automode_status:
-            raise MissingSubnetworkError('No specified subnetwork')
-        else:
-            # the network is in auto mode, the default subnetwork name is the
-            # same as the network name
-            subnetwork = network
+def check_instance_names(instance_names):
+    """ Check the VM names of a migration of several VMs. Each VM can only
+    appear once, either as an original VM or as a new VM, so that two
+    migrations never work on the same VM.
 
-    instance_template = retrieve_instance_template(compute, project, zone,
-                                                   original_instance)
-    try:
-        all_disks_info = get_disks_info_from_instance_template(
-            instance_template)
+        Args:
+            instance_names: a list of (original VM name, new VM name) tuples
+
+        Raises:
+            UnchangedInstanceNameError: if a new VM name is the same as its
+             original VM's name
+            DuplicateInstanceNameError: if a VM name appears more than once
+    """
+    seen_names = set()
+    for original_instance, new_instance in instance_names:
+        if new_instance == original_instance:
+            raise UnchangedInstanceNameError(
+                'The new VM should not have the same name as the original '
+                'VM: ' + original_instance)
+        for name in (original_instance, new_instance):
+            if name in seen_names:
+                raise DuplicateInstanceNameError(
+                    'The VM name appears more than once: ' + name)
+            seen_names.add(name)
+
+
+def migrate_instances(project, zone, instance_names, network, subnetwork,
+                      preserve_external_ip=False, compute=None,
+                      max_workers=8) -> list:
+    """ Migrate several VMs concurrently. The VMs share the compute
+    service and its connection pool.
+
+        Args:
+            project: project ID
+            zone: zone of the VMs
+            instance_names: a list of (original VM name, new VM name) tuples
+            network: name of the target network
+            subnetwork: name of the target subnet
+            preserve_external_ip: preserve the current external IPs or not
+            compute: google API compute engine service. If it is None, a new
+             one will be built with the application default credentials.
+            max_workers: maximum number of VMs migrated at the same time
 
+        Returns:
+            a list of the original VMs' names whose migrations failed
 
-        original_instance_template = copy.deepcopy(instance_template)
+        Raises:
+            UnchangedInstanceNameError: if a new VM name is the same as its
+             original VM's name
+            DuplicateInstanceNameError: if a VM name appears more than once
+            googleapiclient.errors.HttpError: invalid request
+    """
+    check_instance_names(instance_names)
+    preserve_external_ip = confirm_preserve_external_ip(preserve_external_ip)
+    with open_compute_service(compute) as compute, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # All the VMs are in the same zone, so its region is only
+        # requested once
         region = get_zone(compute, project, zone)['region']
-        region_name = region.split('regions/')[1]
-
-        new_network_info = generate_new_network_info(compute, project, region,
-                                                     network, subnetwork)
-        original_network_interface = instance_template['networkInterfaces'][0]
-        new_network_interface = preserve_ip_addresses_handler(compute, project,
-                                                              new_instance,
-                                                              new_network_info,
-                                                              original_network_interface,
-                                                              region_name,
-                                                              preserve_external_ip)
-
-        print('Modifying instance template')
-        new_instance_template = modify_instance_template_with_new_network(
-            instance_template, new_instance, new_network_interface)
-    except Exception as e:
-        print(e)
-        print('An error happens. '
-              'Migration is terminated. '
-              'The original VM is running.')
-        return
+        futures = [
+            (original_instance,
+             executor.submit(migrate_instance, compute, project, zone,
+                             original_instance, new_instance, network,
+                             subnetwork, preserve_external_ip, region))
+            for original_instance, new_instance in instance_names]
+
+    # All the migrations have finished
+    failed_instances = []
+    for original_instance, future in futures:
+        try:
+            migrated = future.result()
+        except Exception as e:
+            with message_prefix(original_instance):
+                print_message(e)
+            migrated = False
+        if not migrated:
+            failed_instances.append(original_instance)
+    if failed_instances:
+        print_message('The migration failed for: ' +
+                      ', '.join(failed_instances))
+    else:
+        print_message('All the migrations are successful.')
+    return failed_instances
 
-    try:
-        print('Stopping the VM')
-        print('stop_instance_operation is running')
-        stop_instance_operation = stop_instance(compute, project, zone,
-                                                original_instance)
-        wait_for_zone_operation(compute, project, zone,
-                                stop_instance_operation['name'])
-    except:
-        rollback_failure_protection(compute, project, zone, original_instance,
-                                    original_instance_template, [], False)
-        return
 
+def migrate_instance(compute, project, zone, original_instance, new_instance,
+                     network, subnetwork, preserve_external_ip,
+                     region=None) -> bool:
+    """ Migrate a VM to the target network.
 
-    try:
-        print('Detaching the disks')
-        for disk_info in all_disks_info:
-            disk = disk_info['deviceName']
-            print('detach_disk_operation is running')
-            detach_disk_operation = detach_disk(compute, project, zone,
-                                                original_instance, disk)
-            wait_for_zone_operation(compute, project, zone,
-                                    detach_disk_operation['name'])
+        Args:
+            compute: google API compute engine service
+            project: project ID
+            zone: zone of the VM
+            original_instance: name of the original VM
+            new_instance: name of the new VM
+            network: name of the target network
+            subnetwork: name of the target subnet
+            preserve_external_ip: preserve the current external IP or not
+            region: selfLink of the zone's region. If it is None, it will be
+             requested.
 
-        print('Deleting the old VM')
-        print('delete_instance_operation is running')
-        delete_instance_operation = delete_instance(compute, project, zone,
-                                                    original_instance)
-        wait_for_zone_operation(compute, project, zone,
-                                delete_instance_operation['name'])
-    except:
-        rollback_failure_protection(compute, project, zone, original_instance,
-                                    original_instance_template,
-                                    all_disks_info, False)
-        return
+        Returns:
+            True if the VM is migrated. False if the migration is terminated
+            or rolled back.
 
-    try:
-        print('Creating a new VM')
-        print('create_instance_operation is running')
-        create_instance_operation = create_instance(compute, project, zone,
-                                                    new_instance_template)
-        wait_for_zone_operation(compute, project, zone,
-                                create_instance_operation['name'])
-    except:
-        rollback_failure_protection(compute, project, zone, original_instance,
-                                    original_instance_template, all_disks_info,
-                                    True)
-        return
-    print('The migration is successful.')
+        Raises:
+            UnchangedInstanceNameError: if new_instance == orignal_instance
+            MissingSubnetworkError: if the network mode is not auto and
+             the subnetwork is not specified
+            googleapiclient.errors.HttpError: invalid request
+    """
+    # The messages are prefixed with the VM name, since several VMs can be
+    # migrated at the same time
+    with message_prefix(original_instance):
+        if new_instance == original_instance:
+            raise UnchangedInstanceNameError(
+                'The new VM should not have the same name as the original VM')
+
+        # The target network is only fetched once, and its information is
+        # reused by the new network interface.
+        network_info = get_network(compute, project, network)
+        # If the network is auto, then the subnetwork name is optional.
+        # Otherwise it should be specified
+        automode_status = get_network_auto_mode(network_info)
+        if subnetwork is None:
+            if not automode_status:
+                raise MissingSubnetworkError('No specified subnetwork')
+            else:
+                # the network is in auto mode, the default subnetwork name is the
+                # same as the network name
+                subnetwork = network
+
+        instance_template = retrieve_instance_template(compute, project, zone,
+                                                       original_instance)
+        try:
+            all_disks_info = get_disks_info_from_instance_template(
+                instance_template)
+
+            original_instance_template = copy.deepcopy(instance_template)
+            if region is None:
+                region = get_zone(compute, project, zone)['region']
+            region_name = region.rsplit('/', 1)[1]
+
+            new_network_info = generate_new_network_info(network_info, region,
+                                                         subnetwork)
+            original_network_interface = instance_template['networkInterfaces'][0]
+            new_network_interface = preserve_ip_addresses_handler(compute, project,
+                                                                  new_instance,
+                                                                  new_network_info,
+                                                                  original_network_interface,
+                                                                  region_name,
+                                                                  preserve_external_ip)
+
+            print_message('Modifying instance template')
+            new_instance_template = modify_instance_template_with_new_network(
+                instance_template, new_instance, new_network_interface)
+        except Exception as e:
+            print_message(e)
+            print_message('An error happens. '
+                          'Migration is terminated. '
+                          'The original VM is running.')
+            return False
+
+        try:
+            print_message('Stopping the VM')
+            print_message('stop_instance_operation is running')
+            stop_instance_operation = stop_instance(compute, project, zone,
+                                                    original_instance)
+            wait_for_zone_operation(compute, project, zone,
+                                    stop_instance_operation['name'])
+        except:
+            rollback_failure_protection(compute, project, zone, original_instance,
+                                        original_instance_template, [], False)
+            return False
+
+        try:
+            print_message('Detaching the disks')
+            for disk_info in all_disks_info:
+                disk = disk_info['deviceName']
+                print_message('detach_disk_operation is running')
+                detach_disk_operation = detach_disk(compute, project, zone,
+                                                    original_instance, disk)
+                wait_for_zone_operation(compute, project, zone,
+                                        detach_disk_operation['name'])
+
+            print_message('Deleting the old VM')
+            print_message('delete_instance_operation is running')
+            delete_instance_operation = delete_instance(compute, project, zone,
+                                                        original_instance)
+            wait_for_zone_operation(compute, project, zone,
+                                    delete_instance_operation['name'])
+        except:
+            rollback_failure_protection(compute, project, zone, original_instance,
+                                        original_instance_template,
+                                        all_disks_info, False)
+            return False
+
+        try:
+            print_message('Creating a new VM')
+            print_message('create_instance_operation is running')
+            create_instance_operation = create_instance(compute, project, zone,
+                                                        new_instance_template)
+            wait_for_zone_operation(compute, project, zone,
+                                    create_instance_operation['name'])
+        except:
+            rollback_failure_protection(compute, project, zone, original_instance,
+                                        original_instance_template, all_disks_info,
+                                        True)
+            return False
+        print_message('The migration is successful.')
+        return True